@@ -0,0 +1,246 @@
+"""Concurrent-session load test for the dashboard.
+
+Drives Home.py and every page through Streamlit's headless AppTest with
+scripted widget interactions, runs many simulated sessions at once and
+reports p50/p95/p99 rerun latency plus peak RSS for each dataset size.
+
+    python load_test.py --sessions 20 --reruns 10 --players 50 200
+"""
+import argparse
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+PAGES = [
+    "Home.py",
+    "pages/1_Pitching.py",
+    "pages/2_Hitting.py",
+    "pages/3_High_Performance.py",
+    "pages/4_Academy.py",
+    "pages/5_Injury_Tracker.py",
+]
+
+PERIOD_BUTTONS = ["Last 30 days", "Last 90 days", "vs. Previous Period", "vs. Previous Year"]
+
+# Runs a page with a resized mock dataset. The page source is executed under a
+# non-__main__ name so generate_mock_data can be swapped before main() runs.
+# AppTest names its script file after a hash of the source, so the session id
+# keeps sessions from rewriting each other's file while it is being read.
+SCRIPT_TEMPLATE = """# session {session_id}
+import functools
+page_path = {page_path!r}
+page_globals = {{"__name__": "__loadtest__", "__file__": page_path}}
+with open(page_path) as f:
+    exec(compile(f.read(), page_path, "exec"), page_globals)
+if "generate_mock_data" in page_globals:
+    page_globals["generate_mock_data"] = functools.partial(
+        page_globals["generate_mock_data"], num_players={num_players}, num_days={num_days})
+page_globals["main"]()
+"""
+
+# Scripted interactions
+def find_widget(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No widget labelled {label!r}")
+
+def click_period(at, step):
+    find_widget(at.button, PERIOD_BUTTONS[step % len(PERIOD_BUTTONS)]).click()
+
+def choose(label, options):
+    def interact(at, step):
+        find_widget(at.selectbox, label).select(options[step % len(options)])
+    return interact
+
+def choose_many(label, choices):
+    def interact(at, step):
+        find_widget(at.multiselect, label).set_value(choices[step % len(choices)])
+    return interact
+
+def rerun(at, step):
+    pass
+
+GYM_TYPES = [['in-gym', 'remote'], ['in-gym'], ['remote']]
+
+INTERACTIONS = {
+    "Home.py": [
+        choose("Location", ["In-gym", "Remote"]),
+        choose("Level", ["Youth", "High School", "College", "Professional"]),
+    ],
+    "pages/1_Pitching.py": [rerun],
+    "pages/2_Hitting.py": [rerun],
+    "pages/3_High_Performance.py": [
+        click_period,
+        choose_many("Select Gym Type", GYM_TYPES),
+        choose("Select Force Type", ["Linear Force Change", "Rotational Force Change", "Total Force Change"]),
+    ],
+    "pages/4_Academy.py": [
+        click_period,
+        choose_many("Select Gym Type", GYM_TYPES),
+    ],
+    "pages/5_Injury_Tracker.py": [
+        click_period,
+        choose_many("Select Gym Type", GYM_TYPES),
+        choose_many("Select Specific Gym", [['WA', 'AZ', 'FL', 'Fully Remote'], ['WA', 'AZ'], ['FL', 'Fully Remote']]),
+    ],
+}
+
+# AppTest swaps process-wide state around every run: it installs and tears
+# down its own mock Runtime and resets the cached page registry, which races
+# once sessions share a process. A real server has one Runtime for all
+# sessions, so install a single one, and give each session's script its own
+# page registry entry instead of the shared cache.
+def prepare_concurrent_sessions():
+    from unittest.mock import MagicMock
+
+    from streamlit import source_util
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.util import calc_md5
+
+    shared_runtime = MagicMock(spec=Runtime)
+    shared_runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    shared_runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime.instance = classmethod(lambda cls: shared_runtime)
+    Runtime.exists = classmethod(lambda cls: True)
+
+    def get_pages(main_script_path):
+        page_script_hash = calc_md5(main_script_path)
+        return {page_script_hash: {
+            "page_script_hash": page_script_hash,
+            "page_name": Path(main_script_path).stem,
+            "icon": "",
+            "script_path": str(Path(main_script_path).resolve()),
+        }}
+
+    source_util.get_pages = get_pages
+
+# One simulated coach: load the page, then rerun it once per interaction
+def run_session(session_id, page, num_players, num_days, reruns, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    script = SCRIPT_TEMPLATE.format(session_id=session_id, page_path=str(REPO_ROOT / page),
+                                    num_players=num_players, num_days=num_days)
+    at = AppTest.from_string(script, default_timeout=timeout)
+    interactions = INTERACTIONS[page]
+    samples = []
+    errors = 0
+
+    # A failed rerun is counted and left out of the latencies, and the
+    # session carries on with its next interaction
+    for step in range(reruns + 1):
+        try:
+            # A missing widget means the page broke, so it counts as a failed rerun
+            if step > 0:
+                interactions[(step - 1) % len(interactions)](at, (step - 1) // len(interactions) + session_id)
+            started = time.perf_counter()
+            at.run()
+            elapsed = time.perf_counter() - started
+            failed = len(at.exception) > 0
+        except Exception:
+            failed = True
+        if failed:
+            errors += 1
+            continue
+        samples.append({'page': page, 'kind': 'initial' if step == 0 else 'rerun', 'seconds': elapsed})
+
+    return page, samples, errors
+
+# Peak resident set size of this process in MB
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+# Run every session for one dataset size, concurrently, in the current process
+def run_scenario(pages, sessions, concurrency, num_players, num_days, reruns, timeout):
+    os.chdir(REPO_ROOT)
+    prepare_concurrent_sessions()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(run_session, i, pages[i % len(pages)], num_players, num_days, reruns, timeout)
+                   for i in range(sessions)]
+        results = [future.result() for future in futures]
+    wall_seconds = time.perf_counter() - started
+
+    samples = [sample for _, session_samples, _ in results for sample in session_samples]
+    errors = {}
+    for page, _, session_errors in results:
+        errors[page] = errors.get(page, 0) + session_errors
+    return samples, errors, wall_seconds, peak_rss_mb()
+
+# Latency percentiles and error counts per page plus an overall row.
+# errors maps each page to the failed reruns across its sessions.
+def summarize(samples, num_players, num_days, errors, wall_seconds, rss_mb):
+    df = pd.DataFrame(samples, columns=['page', 'kind', 'seconds'])
+    rows = []
+    groups = [(page, df[df['page'] == page], errors.get(page, 0)) for page in sorted(errors)]
+    groups.append(("ALL", df, sum(errors.values())))
+
+    for page, page_df, page_errors in groups:
+        reruns = page_df[page_df['kind'] == 'rerun']['seconds'].to_numpy() * 1000
+        initial = page_df[page_df['kind'] == 'initial']['seconds'].to_numpy() * 1000
+        p50, p95, p99 = np.percentile(reruns, [50, 95, 99]) if len(reruns) else (np.nan,) * 3
+        rows.append({
+            'players': num_players,
+            'days': num_days,
+            'page': page,
+            'reruns': len(reruns),
+            'initial_ms': initial.mean() if len(initial) else np.nan,
+            'p50_ms': p50,
+            'p95_ms': p95,
+            'p99_ms': p99,
+            'max_ms': reruns.max() if len(reruns) else np.nan,
+            'errors': page_errors,
+        })
+
+    summary = pd.DataFrame(rows)
+    summary['wall_s'] = wall_seconds
+    summary['peak_rss_mb'] = rss_mb
+    return summary
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the dashboard")
+    parser.add_argument("--sessions", type=int, default=12, help="simulated sessions per dataset size")
+    parser.add_argument("--concurrency", type=int, default=None, help="sessions running at once (default: all)")
+    parser.add_argument("--reruns", type=int, default=8, help="scripted interactions per session")
+    parser.add_argument("--players", type=int, nargs="+", default=[50], help="dataset sizes (players) to test")
+    parser.add_argument("--days", type=int, default=365, help="days of mock data per player")
+    parser.add_argument("--pages", nargs="+", default=PAGES, choices=PAGES, help="pages to drive")
+    parser.add_argument("--timeout", type=float, default=120, help="per-rerun timeout in seconds")
+    parser.add_argument("--csv", help="also write the results to this CSV file")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    concurrency = args.concurrency or args.sessions
+    summaries = []
+
+    for num_players in args.players:
+        # A fresh process per dataset size so peak RSS is not carried over
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            samples, errors, wall_seconds, rss_mb = pool.submit(
+                run_scenario, args.pages, args.sessions, concurrency,
+                num_players, args.days, args.reruns, args.timeout).result()
+        summary = summarize(samples, num_players, args.days, errors, wall_seconds, rss_mb)
+        print(summary.to_string(index=False, float_format=lambda v: f"{v:.1f}"), end="\n\n", flush=True)
+        summaries.append(summary)
+
+    if args.csv:
+        pd.concat(summaries).to_csv(args.csv, index=False)
+
+if __name__ == "__main__":
+    main()
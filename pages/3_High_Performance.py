@@ -4,11 +4,13 @@ import plotly.express as px
 import numpy as np
 from datetime import datetime, date, timedelta
 from streamlit_extras.app_logo import add_logo
+from precompute import AGGREGATE_CACHE_ENTRIES, PERIOD_DAYS, box_figure, box_stats, precompute_other_periods
 
-# Mock data generation
-def generate_mock_data(num_players=50, num_days=365):
+# Mock data generation, cached per day so the data moves with the period windows
+@st.cache_data(max_entries=2)
+def generate_mock_data(end_date, num_players=50, num_days=365):
     players = [f"Player {i}" for i in range(1, num_players + 1)]
-    dates = pd.date_range(end=date.today(), periods=num_days)
+    dates = pd.date_range(end=end_date, periods=num_days)
     data = []
     
     for player in players:
@@ -27,44 +29,22 @@ def generate_mock_data(num_players=50, num_days=365):
 
 # Time period selection
 def select_time_period():
-    col1, col2, col3, col4 = st.columns(4)
+    columns = st.columns(len(PERIOD_DAYS))
+    selected_period = "Last 30 days"
     
-    with col1:
-        last_30 = st.button("Last 30 days")
-    with col2:
-        last_90 = st.button("Last 90 days")
-    with col3:
-        vs_previous = st.button("vs. Previous Period")
-    with col4:
-        vs_year = st.button("vs. Previous Year")
+    for column, period in zip(columns, PERIOD_DAYS):
+        with column:
+            if st.button(period):
+                selected_period = period
     
     end_date = date.today()
-    if last_30:
-        start_date = end_date - timedelta(days=30)
-        selected_period = "Last 30 days"
-    elif last_90:
-        start_date = end_date - timedelta(days=90)
-        selected_period = "Last 90 days"
-    elif vs_previous:
-        start_date = end_date - timedelta(days=60)
-        selected_period = "vs. Previous Period"
-    elif vs_year:
-        start_date = end_date - timedelta(days=365)
-        selected_period = "vs. Previous Year"
-    else:
-        start_date = end_date - timedelta(days=30)
-        selected_period = "Last 30 days"
+    start_date = end_date - timedelta(days=PERIOD_DAYS[selected_period])
     
     return start_date, end_date, selected_period
 
-# High Performance Page
-def high_performance_page(df):
-    st.header("High Performance Metrics")
-    
-    start_date, end_date, selected_period = select_time_period()
-    
-    gym_type = st.sidebar.multiselect("Select Gym Type", ['in-gym', 'remote'], default=['in-gym', 'remote'])
-    
+# Period-dependent aggregates for the High Performance page
+@st.cache_data(show_spinner=False, max_entries=AGGREGATE_CACHE_ENTRIES)
+def compute_high_performance_aggregates(df, start_date, end_date, gym_type):
     filtered_df = df[(df['date'] >= pd.Timestamp(start_date)) & 
                      (df['date'] <= pd.Timestamp(end_date))]
     
@@ -75,28 +55,48 @@ def high_performance_page(df):
     else:
         gym_filtered_df = filtered_df[filtered_df['gym'] == 'Remote']
     
+    force_columns = ['linear_force', 'rotational_force', 'total_force']
+    
+    return {
+        'expected_velo_box': box_stats(gym_filtered_df, 'expected_velo'),
+        'force_values': gym_filtered_df[force_columns].reset_index(drop=True),
+        'in_gym_trend': gym_filtered_df[gym_filtered_df['gym'] != 'Remote'].groupby('date')['expected_velo'].mean().reset_index(),
+        'remote_trend': gym_filtered_df[gym_filtered_df['gym'] == 'Remote'].groupby('date')['expected_velo'].mean().reset_index(),
+        'player_avg': gym_filtered_df.groupby('player')['expected_velo'].mean().reset_index(),
+        'force_trend': gym_filtered_df.groupby('date')[force_columns].mean().reset_index(),
+        'player_force': gym_filtered_df.groupby('player')[force_columns].mean()
+    }
+
+# High Performance Page
+def high_performance_page(df):
+    st.header("High Performance Metrics")
+    
+    start_date, end_date, selected_period = select_time_period()
+    
+    gym_type = st.sidebar.multiselect("Select Gym Type", ['in-gym', 'remote'], default=['in-gym', 'remote'])
+    
+    aggregates = compute_high_performance_aggregates(df, start_date, end_date, gym_type)
+    
     st.subheader("Expected Velo")
-    fig_expected_velo = px.box(gym_filtered_df, x='gym', y='expected_velo', color='gym', 
-                               title=f"Expected Velo Distribution by Gym Type ({selected_period})")
+    fig_expected_velo = box_figure(aggregates['expected_velo_box'], 'expected_velo',
+                                   f"Expected Velo Distribution by Gym Type ({selected_period})")
     st.plotly_chart(fig_expected_velo)
     
     if 'in-gym' in gym_type:
         st.subheader("In-gym Expected Velo Trend")
-        in_gym_df = gym_filtered_df[gym_filtered_df['gym'] != 'Remote']
-        fig_in_gym = px.line(in_gym_df.groupby('date')['expected_velo'].mean().reset_index(), 
+        fig_in_gym = px.line(aggregates['in_gym_trend'], 
                              x='date', y='expected_velo', title="In-gym Expected Velo Trend")
         st.plotly_chart(fig_in_gym)
     
     if 'remote' in gym_type:
         st.subheader("Remote Expected Velo Trend")
-        remote_df = gym_filtered_df[gym_filtered_df['gym'] == 'Remote']
-        fig_remote = px.line(remote_df.groupby('date')['expected_velo'].mean().reset_index(), 
+        fig_remote = px.line(aggregates['remote_trend'], 
                              x='date', y='expected_velo', title="Remote Expected Velo Trend")
         st.plotly_chart(fig_remote)
 
     # Additional High Performance Metrics
     st.subheader("Player Performance Distribution")
-    player_avg = gym_filtered_df.groupby('player')['expected_velo'].mean().reset_index()
+    player_avg = aggregates['player_avg']
     fig_player_dist = px.histogram(player_avg, x='expected_velo', 
                                    title="Distribution of Player Average Expected Velo")
     st.plotly_chart(fig_player_dist)
@@ -122,23 +122,26 @@ def high_performance_page(df):
         force_column = 'total_force'
         title = "Total Force Change Over Time"
 
-    force_df = gym_filtered_df.groupby('date')[force_column].mean().reset_index()
+    force_df = aggregates['force_trend'][['date', force_column]]
     fig_force = px.line(force_df, x='date', y=force_column, title=title)
     st.plotly_chart(fig_force)
 
     # Force Distribution
     st.subheader(f"{force_type} Distribution")
-    fig_force_dist = px.histogram(gym_filtered_df, x=force_column, 
+    fig_force_dist = px.histogram(aggregates['force_values'], x=force_column, 
                                   title=f"Distribution of {force_type}")
     st.plotly_chart(fig_force_dist)
 
     # Top Performers by Force
     st.subheader(f"Top Performers by {force_type}")
-    top_force_players = gym_filtered_df.groupby('player')[force_column].mean().nlargest(10).reset_index()
+    top_force_players = aggregates['player_force'][force_column].nlargest(10).reset_index()
     fig_top_force = px.bar(top_force_players, x='player', y=force_column, 
                            title=f"Top 10 Players by {force_type}")
     st.plotly_chart(fig_top_force)
 
+    # Warm the cache for the other period buttons while the coach reads this view
+    precompute_other_periods(compute_high_performance_aggregates, df, end_date, selected_period, gym_type)
+
 # Main app
 def main():
     st.set_page_config(page_title="High Performance Metrics Dashboard", layout="wide")
@@ -152,7 +155,7 @@ def main():
     st.title("High Performance Metrics Dashboard")
     
     # Generate mock data
-    df = generate_mock_data()
+    df = generate_mock_data(date.today())
     
     # Ensure 'date' column is datetime
     df['date'] = pd.to_datetime(df['date'])
@@ -5,12 +5,14 @@ import plotly.graph_objects as go
 import numpy as np
 from datetime import datetime, date, timedelta
 from streamlit_extras.app_logo import add_logo
+from precompute import AGGREGATE_CACHE_ENTRIES, PERIOD_DAYS, precompute_other_periods
+from workload_alerts import flag_athletes
 
-# Mock data generation
-def generate_mock_data(num_players=50, num_days=365):
+# Mock data generation, cached per day so the data moves with the period windows
+@st.cache_data(max_entries=2)
+def generate_mock_data(end_date, num_players=50, num_days=365):
     players = [f"Player {i}" for i in range(1, num_players + 1)]
-    end_date = pd.Timestamp.now().floor('D')
-    dates = pd.date_range(end=end_date, periods=num_days)
+    dates = pd.date_range(end=pd.Timestamp(end_date), periods=num_days)
     data = []
     
     for player in players:
@@ -28,47 +30,32 @@ def generate_mock_data(num_players=50, num_days=365):
                 'is_injured': is_injured,
                 'injury_type': np.random.choice(['Shoulder', 'Elbow', 'Back', 'Knee', 'Ankle']) if is_injured else None,
                 'gym': gym,
-                'gym_type': gym_type
+                'gym_type': gym_type,
+                'workout_type': np.random.choice(['mocap', 'pen', 'hybrid A', 'hybrid B', 'recovery', 'Live At-Bats', 'In-Game Collection']),
+                'max_throwing_velo': np.random.normal(85, 5),
+                'expected_velo': np.random.normal(92, 3)
             })
     
     return pd.DataFrame(data)
 
 # Time period selection
 def select_time_period():
-    col1, col2, col3, col4 = st.columns(4)
+    columns = st.columns(len(PERIOD_DAYS))
+    selected_period = "Last 30 days"
     
-    with col1:
-        last_30 = st.button("Last 30 days")
-    with col2:
-        last_90 = st.button("Last 90 days")
-    with col3:
-        vs_previous = st.button("vs. Previous Period")
-    with col4:
-        vs_year = st.button("vs. Previous Year")
+    for column, period in zip(columns, PERIOD_DAYS):
+        with column:
+            if st.button(period):
+                selected_period = period
     
     end_date = date.today()
-    if last_30:
-        start_date = end_date - timedelta(days=30)
-        selected_period = "Last 30 days"
-    elif last_90:
-        start_date = end_date - timedelta(days=90)
-        selected_period = "Last 90 days"
-    elif vs_previous:
-        start_date = end_date - timedelta(days=60)
-        selected_period = "vs. Previous Period"
-    elif vs_year:
-        start_date = end_date - timedelta(days=365)
-        selected_period = "vs. Previous Year"
-    else:
-        start_date = end_date - timedelta(days=30)
-        selected_period = "Last 30 days"
+    start_date = end_date - timedelta(days=PERIOD_DAYS[selected_period])
     
     return start_date, end_date, selected_period
 
-# Injury Tracker Page
-def injury_tracker_page(df, gym_type, specific_gym):
-    start_date, end_date, selected_period = select_time_period()
-    
+# Period-dependent aggregates for the Injury Tracker page
+@st.cache_data(show_spinner=False, max_entries=AGGREGATE_CACHE_ENTRIES)
+def compute_injury_aggregates(df, start_date, end_date, gym_type, specific_gym):
     filtered_df = df[(df['date'] >= pd.Timestamp(start_date)) & 
                      (df['date'] <= pd.Timestamp(end_date)) &
                      (df['gym_type'].isin(gym_type)) &
@@ -77,6 +64,36 @@ def injury_tracker_page(df, gym_type, specific_gym):
     active_dl = filtered_df[filtered_df['is_injured']].groupby('date')['player'].nunique()
     total_players = filtered_df.groupby('date')['player'].nunique()
     injury_rate = (active_dl / total_players * 100).fillna(0)
+
+    injury_durations = []
+    for player in filtered_df['player'].unique():
+        player_data = filtered_df[filtered_df['player'] == player]['is_injured']
+        injury_periods = player_data.ne(player_data.shift()).cumsum()[player_data]
+        durations = injury_periods.groupby(injury_periods).size()
+        injury_durations.extend(durations.tolist())
+
+    return {
+        'active_dl': active_dl,
+        'total_players': total_players,
+        'injury_rate': injury_rate,
+        'injury_type_dist': filtered_df[filtered_df['is_injured']]['injury_type'].value_counts(),
+        'injury_durations': injury_durations,
+        'gym_injury_rate': filtered_df.groupby('gym').apply(lambda x: (x['is_injured'].sum() / len(x)) * 100).sort_values(ascending=False)
+    }
+
+# Early-warning flags as of each athlete's latest session
+@st.cache_data(show_spinner=False)
+def compute_flagged_athletes(df):
+    return flag_athletes(df)
+
+# Injury Tracker Page
+def injury_tracker_page(df, gym_type, specific_gym):
+    start_date, end_date, selected_period = select_time_period()
+    
+    aggregates = compute_injury_aggregates(df, start_date, end_date, gym_type, specific_gym)
+    active_dl = aggregates['active_dl']
+    total_players = aggregates['total_players']
+    injury_rate = aggregates['injury_rate']
     
     st.subheader("Active DL vs Total Players")
     fig = go.Figure()
@@ -92,31 +109,34 @@ def injury_tracker_page(df, gym_type, specific_gym):
 
     # Additional Injury Tracker analyses
     st.subheader("Injury Type Distribution")
-    injury_type_dist = filtered_df[filtered_df['is_injured']]['injury_type'].value_counts()
+    injury_type_dist = aggregates['injury_type_dist']
     fig_injury_type = px.pie(values=injury_type_dist.values, names=injury_type_dist.index, 
                              title="Distribution of Injury Types")
     st.plotly_chart(fig_injury_type)
 
     st.subheader("Injury Duration")
-    injury_durations = []
-    for player in filtered_df['player'].unique():
-        player_data = filtered_df[filtered_df['player'] == player]['is_injured']
-        injury_periods = player_data.ne(player_data.shift()).cumsum()[player_data]
-        durations = injury_periods.groupby(injury_periods).size()
-        injury_durations.extend(durations.tolist())
-
-    fig_duration = px.histogram(x=injury_durations, nbins=20,
+    fig_duration = px.histogram(x=aggregates['injury_durations'], nbins=20,
                                 title="Distribution of Injury Durations",
                                 labels={'x': 'Duration (days)', 'y': 'Count'})
     st.plotly_chart(fig_duration)
 
     st.subheader("Injury Rate by Gym")
-    gym_injury_rate = filtered_df.groupby('gym').apply(lambda x: (x['is_injured'].sum() / len(x)) * 100).sort_values(ascending=False)
+    gym_injury_rate = aggregates['gym_injury_rate']
     fig_gym_rate = px.bar(x=gym_injury_rate.index, y=gym_injury_rate.values,
                           title="Injury Rate by Gym",
                           labels={'x': 'Gym', 'y': 'Injury Rate (%)'})
     st.plotly_chart(fig_gym_rate)
 
+    st.subheader("Early-Warning Flags")
+    flagged = compute_flagged_athletes(df)
+    flagged = flagged[flagged['gym_type'].isin(gym_type) & flagged['gym'].isin(specific_gym)]
+    st.dataframe(flagged[['player', 'date', 'gym', 'acute_load', 'chronic_load', 'acwr',
+                          'max_throwing_velo_z', 'expected_velo_z', 'alerts']],
+                 hide_index=True, use_container_width=True)
+
+    # Warm the cache for the other period buttons while the coach reads this view
+    precompute_other_periods(compute_injury_aggregates, df, end_date, selected_period, gym_type, specific_gym)
+
 def main():
     st.set_page_config(page_title="Injury Tracker Dashboard", layout="wide")
 
@@ -133,7 +153,7 @@ def main():
     st.title("Injury Tracker Dashboard")
     
     # Generate mock data
-    df = generate_mock_data()
+    df = generate_mock_data(date.today())
     
     # Display the injury tracker page
     injury_tracker_page(df, gym_type, specific_gym)
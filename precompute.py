@@ -0,0 +1,109 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+
+# Period buttons shown by every page's select_time_period, and the days each covers
+PERIOD_DAYS = {
+    "Last 30 days": 30,
+    "Last 90 days": 90,
+    "vs. Previous Period": 60,
+    "vs. Previous Year": 365,
+}
+
+# Entries kept by each page's aggregate cache: every period for up to eight
+# filter selections, so memory stays bounded however many coaches connect
+AGGREGATE_CACHE_ENTRIES = 32
+
+# Box plot statistics per gym, using plotly's linear quartiles and 1.5 IQR
+# whiskers. Gyms keep their order of appearance, as px.box orders them, and
+# the few values outside the fences are kept so outliers still show.
+def box_stats(df, column):
+    stats = {}
+    for gym, values in df.groupby('gym', sort=False)[column]:
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        stats[gym] = {
+            'q1': q1, 'median': median, 'q3': q3,
+            'lowerfence': inside.min(), 'upperfence': inside.max(),
+            'outliers': values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)].to_numpy()
+        }
+    return stats
+
+# Draws box_stats the way px.box(df, x='gym', y=column, color='gym') does,
+# with each gym's outliers as markers on its box
+def box_figure(stats, column, title):
+    fig = go.Figure()
+    colors = px.colors.qualitative.Plotly
+    for i, (gym, gym_stats) in enumerate(stats.items()):
+        color = colors[i % len(colors)]
+        fig.add_trace(go.Box(x=[gym], name=gym, legendgroup=gym, marker_color=color,
+                             q1=[gym_stats['q1']], median=[gym_stats['median']], q3=[gym_stats['q3']],
+                             lowerfence=[gym_stats['lowerfence']], upperfence=[gym_stats['upperfence']]))
+        fig.add_trace(go.Scatter(x=[gym] * len(gym_stats['outliers']), y=gym_stats['outliers'], mode='markers',
+                                 name=gym, legendgroup=gym, showlegend=False, marker_color=color))
+    fig.update_layout(title=title, xaxis_title='gym', yaxis_title=column, legend_title_text='gym')
+    return fig
+
+# One worker pool shared by every session on the server
+@st.cache_resource
+def get_precompute_pool():
+    return ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                              thread_name_prefix="period-precompute")
+
+# Runs in a pool thread. Calling the st.cache_data function stores its result
+# in the cache, so the page picks it up instantly when that period is clicked.
+# st.cache_data only writes results from a thread with a ScriptRunContext, so
+# borrow the session's for the duration of the call.
+def warm_period(ctx, cancelled, compute, df, start_date, end_date, filters):
+    if cancelled.is_set():
+        return
+    thread = threading.current_thread()
+    add_script_run_ctx(thread, ctx)
+    try:
+        compute(df, start_date, end_date, *filters)
+    finally:
+        setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+
+# Speculatively compute the periods that are not on screen in the background.
+# compute must be an st.cache_data function taking (df, start_date, end_date, *filters).
+# Work queued for an earlier filter selection is cancelled once filters change.
+# The aggregate caches are shared by every session, so other coaches can evict
+# a warmed period; finished periods are queued again on the next rerun, which
+# is a cache hit while the entry is still there and recomputes it once evicted.
+def precompute_other_periods(compute, df, end_date, selected_period, *filters):
+    state_key = f"precompute_{compute.__name__}"
+    filters_key = repr((end_date, filters))
+    previous = st.session_state.get(state_key)
+
+    if previous is not None and previous['filters'] == filters_key:
+        cancelled = previous['cancelled']
+        futures = previous['futures']
+    else:
+        if previous is not None:
+            previous['cancelled'].set()
+            for future in previous['futures'].values():
+                future.cancel()
+        cancelled = threading.Event()
+        futures = {}
+
+    pool = get_precompute_pool()
+    ctx = get_script_run_ctx()
+    for period, days in PERIOD_DAYS.items():
+        if period == selected_period:
+            continue
+        # Still queued or running from an earlier rerun
+        if period in futures and not futures[period].done():
+            continue
+        start_date = end_date - timedelta(days=days)
+        futures[period] = pool.submit(warm_period, ctx, cancelled, compute, df, start_date, end_date, filters)
+
+    st.session_state[state_key] = {'filters': filters_key, 'cancelled': cancelled, 'futures': futures}
@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+
+# Workout types that count towards throwing workload
+HIGH_INTENSITY_WORKOUTS = ['mocap', 'pen', 'hybrid A']
+
+# Rolling windows in days
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+# Alert thresholds
+ACWR_THRESHOLD = 1.5
+VELO_Z_THRESHOLD = -1.0
+
+VELO_METRICS = ['max_throwing_velo', 'expected_velo']
+
+ALERT_COLUMNS = ['acute_load', 'chronic_load', 'acwr'] + [f'{metric}_z' for metric in VELO_METRICS]
+
+# Longest lookback of any window, in days
+LOOKBACK_DAYS = ACUTE_DAYS + CHRONIC_DAYS - 1
+
+# Prefix sums of a dense player-major, date-minor grid holding the per-day sum
+# of values. Each player's block starts with LOOKBACK_DAYS of zero padding so
+# no window reaches back into the previous player.
+def grid_prefix_sums(keys, values, grid_size):
+    return np.concatenate(([0], np.cumsum(np.bincount(keys, weights=values, minlength=grid_size))))
+
+# Rolling sum over [day - back_from, day - back_to] for every grid cell,
+# taken as the difference of two shifted slices of the prefix sums
+def rolling_sum(prefix_sums, back_from, back_to):
+    grid_size = len(prefix_sums) - 1
+    sums = np.zeros(grid_size)
+    sums[back_from:] = prefix_sums[back_from + 1 - back_to:grid_size + 1 - back_to] - prefix_sums[:grid_size - back_from]
+    return sums
+
+# Rolling acute:chronic workload ratio and velo z-scores for every player/day.
+# All players are computed at once on one grid, with no per-player loop.
+# With latest_only, only the last session of each player's latest day is
+# returned, which is all the early-warning table needs.
+def compute_workload_alerts(df, latest_only=False):
+    if df.empty:
+        return df.reset_index(drop=True).assign(**{column: pd.Series(dtype=float) for column in ALERT_COLUMNS})
+
+    player_codes, players = pd.factorize(df['player'])
+    day_numbers = df['date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+    day_numbers = day_numbers - day_numbers.min()
+
+    span = day_numbers.max() + 1 + LOOKBACK_DAYS
+    keys = player_codes.astype(np.int64) * span + LOOKBACK_DAYS + day_numbers
+    grid_size = len(players) * span
+
+    # Days each player trained on, one grid row per player, giving their first and latest day
+    trained = np.bincount(keys, minlength=grid_size).reshape(len(players), span) > 0
+    first_day = trained.argmax(axis=1) - LOOKBACK_DAYS
+
+    if latest_only:
+        last_day = span - 1 - trained[:, ::-1].argmax(axis=1) - LOOKBACK_DAYS
+        on_last_day = np.flatnonzero(day_numbers == last_day[player_codes])[::-1]
+        _, last_session = np.unique(player_codes[on_last_day], return_index=True)
+        rows = np.sort(on_last_day[last_session])
+    else:
+        rows = slice(None)
+
+    result = df.iloc[rows].reset_index(drop=True)
+    row_keys = keys[rows]
+
+    # Days of history each row has, so the ratio is only trusted once the chronic window is full
+    history_days = day_numbers[rows] - first_day[player_codes[rows]] + 1
+
+    # Acute:chronic workload ratio from high-intensity session counts
+    sessions = grid_prefix_sums(keys, df['workout_type'].isin(HIGH_INTENSITY_WORKOUTS).to_numpy(dtype=float), grid_size)
+    acute_load = rolling_sum(sessions, ACUTE_DAYS - 1, 0)[row_keys]
+    chronic_load = rolling_sum(sessions, CHRONIC_DAYS - 1, 0)[row_keys] * ACUTE_DAYS / CHRONIC_DAYS
+    with np.errstate(divide='ignore', invalid='ignore'):
+        acwr = acute_load / chronic_load
+    alerts = {
+        'acute_load': acute_load,
+        'chronic_load': chronic_load,
+        'acwr': np.where((history_days >= CHRONIC_DAYS) & (chronic_load > 0), acwr, np.nan)
+    }
+
+    # Acute mean velo against the chronic window that precedes it
+    for metric in VELO_METRICS:
+        values = df[metric].to_numpy(dtype=float)
+        valid = np.isfinite(values)
+        values = np.where(valid, values, 0.0)
+        counts = grid_prefix_sums(keys, valid.astype(float), grid_size)
+        sums = grid_prefix_sums(keys, values, grid_size)
+        squares = grid_prefix_sums(keys, values ** 2, grid_size)
+
+        acute_n = rolling_sum(counts, ACUTE_DAYS - 1, 0)[row_keys]
+        acute_sum = rolling_sum(sums, ACUTE_DAYS - 1, 0)[row_keys]
+        base_n = rolling_sum(counts, LOOKBACK_DAYS, ACUTE_DAYS)[row_keys]
+        base_sum = rolling_sum(sums, LOOKBACK_DAYS, ACUTE_DAYS)[row_keys]
+        base_squares = rolling_sum(squares, LOOKBACK_DAYS, ACUTE_DAYS)[row_keys]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            acute_mean = acute_sum / acute_n
+            base_mean = base_sum / base_n
+            base_var = (base_squares - base_sum * base_mean) / (base_n - 1)
+            z = (acute_mean - base_mean) / np.sqrt(base_var)
+        usable = (acute_n > 0) & (base_n > 1) & (base_var > 0)
+        alerts[f'{metric}_z'] = np.where(usable, z, np.nan)
+
+    # Added in one go so the frame is not consolidated once per column
+    return pd.concat([result, pd.DataFrame(alerts)], axis=1)
+
+# Athletes whose latest day trips an alert, one row each, highest workload first
+def flag_athletes(df, acwr_threshold=ACWR_THRESHOLD, velo_z_threshold=VELO_Z_THRESHOLD):
+    latest = compute_workload_alerts(df, latest_only=True)
+
+    reasons = pd.Series('', index=latest.index)
+    high_workload = latest['acwr'] > acwr_threshold
+    reasons[high_workload] += 'Workload spike; '
+    for metric in VELO_METRICS:
+        velo_drop = latest[f'{metric}_z'] < velo_z_threshold
+        reasons[velo_drop] += f"{metric.replace('_', ' ').title()} drop; "
+
+    latest['alerts'] = reasons.str.rstrip('; ')
+    flagged = latest[latest['alerts'] != '']
+    return flagged.sort_values('acwr', ascending=False).reset_index(drop=True)
+
+# Per-player pandas time-based rolling over the same windows, computed the slow
+# way, as the reference for the grid arithmetic. One blank row per calendar day
+# lets each day's last row close every window, trained on or not.
+def reference_workload_alerts(df):
+    frames = []
+    for player, sessions in df.groupby('player'):
+        calendar = pd.DataFrame({'date': pd.date_range(sessions['date'].min(), sessions['date'].max())})
+        rows = pd.concat([calendar, sessions.assign(row=sessions.index)]).sort_values('date', kind='stable')
+        rows['high_intensity'] = rows['workout_type'].isin(HIGH_INTENSITY_WORKOUTS).astype(float)
+        rolling = rows.set_index('date')
+
+        days = pd.DataFrame({
+            'acute_load': rolling['high_intensity'].rolling(f'{ACUTE_DAYS}D').sum().to_numpy(),
+            'chronic_load': rolling['high_intensity'].rolling(f'{CHRONIC_DAYS}D').sum().to_numpy() * ACUTE_DAYS / CHRONIC_DAYS,
+            'history_days': (rows['date'] - rows['date'].min()).dt.days.to_numpy() + 1,
+        }, index=rows['date'])
+        for metric in VELO_METRICS:
+            days[f'{metric}_n'] = rolling[metric].rolling(f'{ACUTE_DAYS}D').count().to_numpy()
+            days[f'{metric}_mean'] = rolling[metric].rolling(f'{ACUTE_DAYS}D').mean().to_numpy()
+            days[f'{metric}_base_n'] = rolling[metric].rolling(f'{CHRONIC_DAYS}D').count().to_numpy()
+            days[f'{metric}_base_mean'] = rolling[metric].rolling(f'{CHRONIC_DAYS}D').mean().to_numpy()
+            days[f'{metric}_base_std'] = rolling[metric].rolling(f'{CHRONIC_DAYS}D').std().to_numpy()
+        days = days[~days.index.duplicated(keep='last')]
+
+        expected = days.reindex(sessions['date']).set_axis(sessions.index)
+        # The velo baseline is the chronic window ending the day before the acute one
+        baseline = days.reindex(sessions['date'] - pd.Timedelta(days=ACUTE_DAYS)).set_axis(sessions.index)
+        expected['acwr'] = (expected['acute_load'] / expected['chronic_load']).where(
+            (expected['history_days'] >= CHRONIC_DAYS) & (expected['chronic_load'] > 0))
+        for metric in VELO_METRICS:
+            base_n = baseline[f'{metric}_base_n'].fillna(0)
+            base_std = baseline[f'{metric}_base_std']
+            z = (expected[f'{metric}_mean'] - baseline[f'{metric}_base_mean']) / base_std
+            expected[f'{metric}_z'] = z.where((expected[f'{metric}_n'] > 0) & (base_n > 1) & (base_std > 0))
+        frames.append(expected[ALERT_COLUMNS])
+    return pd.concat(frames).loc[df.index].reset_index(drop=True)
+
+# Self-checks: python workload_alerts.py
+if __name__ == "__main__":
+    import time
+
+    # Fixed data with date gaps, several sessions on some days and missing velo
+    rng = np.random.default_rng(7)
+    sessions = []
+    for player in ['Player A', 'Player B', 'Player C', 'Player D']:
+        days = np.sort(rng.choice(120, size=rng.integers(60, 100), replace=False))
+        sessions.append(pd.DataFrame({'player': player, 'date': pd.Timestamp('2024-03-01') + pd.to_timedelta(np.repeat(days, rng.integers(1, 4, len(days))), 'D')}))
+    df = pd.concat(sessions).sample(frac=1, random_state=7)
+    df.index = np.arange(len(df)) * 3 + 5
+    df['workout_type'] = rng.choice(['mocap', 'pen', 'hybrid A', 'hybrid B', 'recovery'], len(df))
+    df['max_throwing_velo'] = np.where(rng.random(len(df)) < 0.15, np.nan, rng.normal(85, 5, len(df)))
+    df['expected_velo'] = np.where(rng.random(len(df)) < 0.15, np.nan, rng.normal(92, 3, len(df)))
+
+    alerts = compute_workload_alerts(df)
+    expected = reference_workload_alerts(df)
+    for column in ALERT_COLUMNS:
+        assert expected[column].notna().any(), f"reference {column} is all missing"
+        np.testing.assert_allclose(alerts[column], expected[column], rtol=1e-9, atol=1e-9, err_msg=column)
+    print(f"windows match pandas rolling on {len(df)} sessions")
+
+    # Timing on mock data with one or two sessions a day
+    players = [f"Player {i}" for i in range(1, 3001)]
+    dates = pd.date_range(end=pd.Timestamp.now().floor('D'), periods=180)
+    sessions_per_day = np.random.randint(1, 3, size=len(players) * len(dates))
+    df = pd.DataFrame({
+        'player': np.repeat(np.repeat(players, len(dates)), sessions_per_day),
+        'date': np.repeat(np.tile(dates, len(players)), sessions_per_day),
+    })
+    df['workout_type'] = np.random.choice(['mocap', 'pen', 'hybrid A', 'hybrid B', 'recovery', 'Live At-Bats', 'In-Game Collection'], len(df))
+    df['max_throwing_velo'] = np.random.normal(85, 5, len(df))
+    df['expected_velo'] = np.random.normal(92, 3, len(df))
+
+    started = time.perf_counter()
+    flagged = flag_athletes(df)
+    elapsed = time.perf_counter() - started
+
+    assert flagged['player'].is_unique, "an athlete is flagged more than once"
+    assert flag_athletes(df.iloc[:0]).empty
+    print(f"{len(df)} sessions, {len(flagged)} flagged athletes in {elapsed:.2f}s")